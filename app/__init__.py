@@ -1,28 +1,51 @@
+import click
 from flask import Flask
 from flask_login import LoginManager
 from flask_wtf.csrf import CSRFProtect
-from flask_migrate import Migrate
 from app.models import db
 
-app = Flask(__name__)
-app.config['SECRET_KEY'] = 'sua_chave_secreta_muito_forte_aqui_mude_para_producao'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///agencia.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['WTF_CSRF_ENABLED'] = True
+login_manager = LoginManager()
+csrf = CSRFProtect()
 
-db.init_app(app)
-login_manager = LoginManager(app)
-csrf = CSRFProtect(app)
-migrate = Migrate(app, db)
-
-login_manager.login_view = 'login'
+login_manager.login_view = 'auth.login'
 login_manager.login_message = 'Faça login para acessar o sistema.'
 login_manager.login_message_category = 'info'
 
-from app.models import Usuario
-
 @login_manager.user_loader
 def load_user(user_id):
+    from app.models import Usuario
     return Usuario.query.get(int(user_id))
 
-from app import view
\ No newline at end of file
+def create_app(config=None):
+    app = Flask(__name__)
+
+    from app.config import Config
+    app.config.from_object(Config)
+    if isinstance(config, dict):
+        app.config.from_mapping(config)
+    elif config is not None:
+        app.config.from_object(config)
+
+    db.init_app(app)
+    login_manager.init_app(app)
+    csrf.init_app(app)
+
+    # O Flask-Migrate carrega o alembic inteiro e só é usado pelos comandos
+    # `flask db`; por isso ele só é registrado quando a aplicação é criada
+    # pela CLI do Flask (que roda dentro de um contexto do click).
+    if click.get_current_context(silent=True) is not None:
+        from flask_migrate import Migrate
+        Migrate(app, db)
+
+    register_blueprints(app)
+    return app
+
+def register_blueprints(app):
+    # Os módulos de rotas (e os formulários que eles carregam) só são
+    # importados aqui, quando uma aplicação é de fato criada.
+    from app import auth, pacotes, reservas, historico
+
+    app.register_blueprint(auth.bp)
+    app.register_blueprint(pacotes.bp)
+    app.register_blueprint(reservas.bp)
+    app.register_blueprint(historico.bp)
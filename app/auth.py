@@ -0,0 +1,114 @@
+from flask import Blueprint, current_app, render_template, redirect, url_for, flash
+from flask_login import login_user, logout_user, login_required, current_user
+from app.models import db, Usuario, Historico
+from app.forms import LoginForm, CadastroForm
+from werkzeug.security import check_password_hash, generate_password_hash
+import click
+from sqlalchemy import exc
+
+bp = Blueprint('auth', __name__, cli_group=None)
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if current_user.is_authenticated:
+        return redirect(url_for('pacotes.index'))
+    
+    login_form = LoginForm()
+    cadastro_form = CadastroForm()
+
+    if login_form.validate_on_submit():
+        user = Usuario.query.filter_by(username=login_form.username.data).first()
+        if user and check_password_hash(user.password, login_form.password.data):
+            login_user(user)
+            try:
+                hist = Historico(usuario_id=user.id, acao='login', descricao=f'Usuário {user.username} logou no sistema.')
+                db.session.add(hist)
+                db.session.commit()
+            except exc.SQLAlchemyError:
+                db.session.rollback()
+                flash('Erro ao registrar histórico de login.', 'danger')
+            return redirect(url_for('pacotes.index'))
+        else:
+            flash('Login inválido. Verifique seu usuário e senha.', 'danger')
+            
+    return render_template('login.html', login_form=login_form, cadastro_form=cadastro_form)
+
+@bp.route('/cadastro', methods=['POST'])
+def cadastro():
+    if current_user.is_authenticated:
+        return redirect(url_for('pacotes.index'))
+
+    form = CadastroForm()
+    if form.validate_on_submit():
+        hashed_password = generate_password_hash(form.password.data)
+        
+        user_role = 'atendente'
+        if form.secret_code.data == current_app.config.get('SECRET_ADMIN_CODE', 'DEFAULT_CODE_DO_NOT_USE'):
+            user_role = 'admin'
+
+        novo_usuario = Usuario(
+            username=form.username.data, 
+            email=form.email.data, 
+            password=hashed_password,
+            role=user_role
+        )
+        
+        try:
+            db.session.add(novo_usuario)
+            db.session.commit()
+            flash('Cadastro realizado com sucesso! Por favor, faça o login.', 'success')
+            return redirect(url_for('auth.login'))
+        except exc.IntegrityError:
+            db.session.rollback()
+            flash('Erro: Nome de usuário ou e-mail já cadastrado.', 'danger')
+        except exc.SQLAlchemyError as e:
+            db.session.rollback()
+            flash(f'Ocorreu um erro inesperado no cadastro: {e}', 'danger')
+    else:
+        for field, errors in form.errors.items():
+            for error in errors:
+                flash(f"Erro no campo '{getattr(form, field).label.text}': {error}", 'danger')
+
+    login_form = LoginForm()
+    return render_template('login.html', login_form=login_form, cadastro_form=form)
+
+@bp.route('/logout')
+@login_required
+def logout():
+    try:
+        hist = Historico(usuario_id=current_user.id, acao='logout', descricao=f'Usuário {current_user.username} saiu do sistema.')
+        db.session.add(hist)
+        db.session.commit()
+    except exc.SQLAlchemyError:
+        db.session.rollback()
+
+    logout_user()
+    flash('Logout realizado com sucesso.', 'info')
+    return redirect(url_for('auth.login'))
+
+@bp.cli.command("create-admin")
+@click.argument("username")
+@click.argument("email")
+@click.argument("password")
+def create_admin(username, email, password):
+    if Usuario.query.filter_by(username=username).first():
+        print(f"Erro: Usuário '{username}' já existe.")
+        return
+    if Usuario.query.filter_by(email=email).first():
+        print(f"Erro: Email '{email}' já existe.")
+        return
+
+    hashed_password = generate_password_hash(password)
+    admin_user = Usuario(
+        username=username,
+        email=email,
+        password=hashed_password,
+        role='admin'
+    )
+    try:
+        db.session.add(admin_user)
+        db.session.commit()
+        print(f"Usuário administrador '{username}' criado com sucesso!")
+    except exc.SQLAlchemyError as e:
+        db.session.rollback()
+        print(f"Erro ao criar administrador: {e}")
\ No newline at end of file
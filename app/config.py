@@ -0,0 +1,10 @@
+class Config:
+    SECRET_KEY = 'sua_chave_secreta_muito_forte_aqui_mude_para_producao'
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///agencia.db'
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    WTF_CSRF_ENABLED = True
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    WTF_CSRF_ENABLED = False
@@ -0,0 +1,17 @@
+from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask_login import login_required, current_user
+from app.models import Historico
+
+bp = Blueprint('historico', __name__)
+
+@bp.route('/historico')
+@login_required
+def historico():
+    if current_user.role != 'admin':
+        flash('Acesso negado.', 'danger')
+        return redirect(url_for('pacotes.index'))
+    
+    page = request.args.get('page', 1, type=int)
+    historicos = Historico.query.order_by(Historico.data_acao.desc()).paginate(page=page, per_page=20)
+    
+    return render_template('historico.html', historicos=historicos)
\ No newline at end of file
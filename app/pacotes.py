@@ -0,0 +1,128 @@
+from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask_login import login_required, current_user
+from app.models import db, Pacote, Reserva, Historico
+from app.forms import PacoteForm, DeleteForm
+from datetime import date
+from sqlalchemy import func, exc
+
+bp = Blueprint('pacotes', __name__)
+
+@bp.route('/')
+@login_required
+def index():
+    pacotes_ativos = Pacote.query.filter(Pacote.data_inicio >= date.today()).count()
+    reservas_pendentes = Reserva.query.filter_by(status='ativa').count()
+    
+    subquery = db.session.query(
+        Reserva.pacote_id,
+        func.count(Reserva.id).label('reservas_count')
+    ).filter(Reserva.status == 'ativa').group_by(Reserva.pacote_id).subquery()
+
+    pacotes_com_alerta = db.session.query(
+        Pacote,
+        subquery.c.reservas_count
+    ).outerjoin(subquery, Pacote.id == subquery.c.pacote_id).all()
+
+    alertas = []
+    for pacote, count in pacotes_com_alerta:
+        reservas_count = count or 0
+        if reservas_count < pacote.vagas_min:
+            alertas.append(f"Insuficiente ({reservas_count}/{pacote.vagas_min}) em {pacote.destino}")
+        if reservas_count > pacote.vagas_max:
+            alertas.append(f"Overbooking em {pacote.destino} (excede {pacote.vagas_max} vagas)")
+            
+    return render_template('index.html', pacotes=pacotes_ativos, reservas=reservas_pendentes, alertas=alertas)
+
+@bp.route('/pacotes')
+@login_required
+def listar_pacotes():
+    page = request.args.get('page', 1, type=int)
+    pacotes = Pacote.query.order_by(Pacote.data_inicio.asc()).paginate(page=page, per_page=10)
+    
+    edit_form = PacoteForm()
+    delete_form = DeleteForm()
+    return render_template('gerenciar_pacotes.html', pacotes=pacotes, edit_form=edit_form, delete_form=delete_form)
+
+@bp.route('/pacotes/cadastrar', methods=['GET', 'POST'])
+@login_required
+def cadastrar_pacote():
+    if current_user.role != 'admin':
+        flash('Acesso negado.', 'danger')
+        return redirect(url_for('pacotes.index'))
+    
+    form = PacoteForm()
+    if form.validate_on_submit():
+        novo_pacote = Pacote()
+        form.populate_obj(novo_pacote)
+        
+        try:
+            db.session.add(novo_pacote)
+            db.session.flush()
+
+            hist = Historico(usuario_id=current_user.id, pacote_id=novo_pacote.id, acao='cadastrar_pacote', descricao=f'Pacote "{novo_pacote.destino}" cadastrado por {current_user.username}.')
+            db.session.add(hist)
+            db.session.commit()
+            
+            flash('Pacote cadastrado com sucesso!', 'success')
+            return redirect(url_for('pacotes.listar_pacotes'))
+        except exc.SQLAlchemyError as e:
+            db.session.rollback()
+            flash(f'Ocorreu um erro ao cadastrar o pacote: {e}', 'danger')
+            
+    elif request.method == 'POST':
+        for field, errors in form.errors.items():
+            for error in errors:
+                flash(f"Erro no campo '{getattr(form, field).label.text}': {error}", 'danger')
+            
+    return render_template('cadastrar_pacote.html', form=form)
+
+@bp.route('/pacotes/editar/<int:pacote_id>', methods=['POST'])
+@login_required
+def editar_pacote(pacote_id):
+    if current_user.role != 'admin':
+        flash('Acesso negado.', 'danger')
+        return redirect(url_for('pacotes.listar_pacotes'))
+
+    pacote = Pacote.query.get_or_404(pacote_id)
+    form = PacoteForm()
+
+    if form.validate_on_submit():
+        try:
+            form.populate_obj(pacote)
+            hist = Historico(usuario_id=current_user.id, pacote_id=pacote.id, acao='edicao_pacote', descricao=f'Pacote "{pacote.destino}" editado por {current_user.username}.')
+            db.session.add(hist)
+            db.session.commit()
+            flash('Pacote atualizado com sucesso!', 'success')
+        except exc.SQLAlchemyError as e:
+            db.session.rollback()
+            flash(f'Erro ao atualizar o pacote: {e}', 'danger')
+    else:
+        for field, errors in form.errors.items():
+            for error in errors:
+                flash(f"Erro no campo '{getattr(form, field).label.text}': {error}", 'danger')
+
+    return redirect(url_for('pacotes.listar_pacotes'))
+
+@bp.route('/pacotes/excluir/<int:pacote_id>', methods=['POST'])
+@login_required
+def excluir_pacote(pacote_id):
+    if current_user.role != 'admin':
+        flash('Acesso negado.', 'danger')
+        return redirect(url_for('pacotes.listar_pacotes'))
+
+    pacote = Pacote.query.get_or_404(pacote_id)
+    form = DeleteForm()
+
+    if form.validate_on_submit():
+        try:
+            destino_pacote = pacote.destino
+            hist = Historico(usuario_id=current_user.id, acao='exclusao_pacote', descricao=f'Pacote "{destino_pacote}" excluído por {current_user.username}.')
+            db.session.add(hist)
+            db.session.delete(pacote)
+            db.session.commit()
+            flash('Pacote excluído com sucesso!', 'success')
+        except exc.SQLAlchemyError as e:
+            db.session.rollback()
+            flash(f'Erro ao excluir o pacote: {e}', 'danger')
+    
+    return redirect(url_for('pacotes.listar_pacotes'))
\ No newline at end of file
@@ -0,0 +1,64 @@
+from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask_login import login_required, current_user
+from app.models import db, Pacote, Cliente, Reserva, Historico
+from app.forms import ReservaForm, CancelarReservaForm
+from sqlalchemy import exc
+
+bp = Blueprint('reservas', __name__)
+
+@bp.route('/reservas', methods=['GET', 'POST'])
+@login_required
+def gerenciar_reservas():
+    form = ReservaForm()
+    cancel_form = CancelarReservaForm()
+    
+    page = request.args.get('page', 1, type=int)
+    reservas_ativas = Reserva.query.filter_by(status='ativa').order_by(Reserva.data_reserva.desc()).paginate(page=page, per_page=10)
+    
+    if form.validate_on_submit():
+        pacote = Pacote.query.get_or_404(form.pacote_id.data)
+        if pacote.vagas_disponiveis <= 0:
+            flash('Não há vagas disponíveis para este pacote.', 'danger')
+        else:
+            try:
+                cliente = Cliente.query.filter_by(email=form.cliente_email.data).first()
+                if not cliente:
+                    cliente = Cliente(nome=form.cliente_nome.data, email=form.cliente_email.data)
+                    db.session.add(cliente)
+                    db.session.flush()
+
+                reserva = Reserva(cliente_id=cliente.id, pacote_id=pacote.id, status='ativa')
+                hist = Historico(usuario_id=current_user.id, cliente_id=cliente.id, pacote_id=pacote.id, acao='nova_reserva', descricao=f'Reserva para "{pacote.destino}" criada para o cliente {cliente.nome} por {current_user.username}.')
+                db.session.add(reserva)
+                db.session.add(hist)
+                db.session.commit()
+                flash('Reserva registrada com sucesso!', 'success')
+            except exc.SQLAlchemyError as e:
+                db.session.rollback()
+                flash(f'Erro ao registrar a reserva: {e}', 'danger')
+        
+        return redirect(url_for('reservas.gerenciar_reservas'))
+    
+    return render_template('gerenciar_reservas.html', form=form, reservas=reservas_ativas, cancel_form=cancel_form)
+
+@bp.route('/reservas/cancelar/<int:reserva_id>', methods=['POST'])
+@login_required
+def cancelar_reserva(reserva_id):
+    reserva = Reserva.query.get_or_404(reserva_id)
+    form = CancelarReservaForm()
+
+    if form.validate_on_submit():
+        if reserva.status == 'cancelada':
+            flash('Esta reserva já foi cancelada.', 'info')
+        else:
+            try:
+                reserva.status = 'cancelada'
+                hist = Historico(usuario_id=current_user.id, cliente_id=reserva.cliente_id, pacote_id=reserva.pacote_id, acao='cancelamento_reserva', descricao=f'Reserva para "{reserva.pacote.destino}" do cliente {reserva.cliente.nome} cancelada por {current_user.username}.')
+                db.session.add(hist)
+                db.session.commit()
+                flash('Reserva cancelada com sucesso!', 'success')
+            except exc.SQLAlchemyError as e:
+                db.session.rollback()
+                flash(f'Erro ao cancelar a reserva: {e}', 'danger')
+            
+    return redirect(url_for('reservas.gerenciar_reservas'))
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Mede o tempo de inicialização da aplicação, de um worker e de um comando da CLI.
+
+Cada medição roda em um processo novo, para incluir o custo de import, e é
+precedida de uma execução não cronometrada para aquecer o cache de disco.
+
+    python benchmarks/bench_startup.py [repeticoes]
+"""
+import http.client
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASOS = {
+    'import do pacote app': [sys.executable, '-c', 'import app'],
+    'mestre (create_app)': [sys.executable, '-c', 'from app import create_app; create_app()'],
+    'cli (flask create-admin --help)': [sys.executable, '-m', 'flask', '--app', 'app', 'create-admin', '--help'],
+}
+
+def porta_livre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def rodar_comando(cmd):
+    subprocess.run(cmd, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+
+def rodar_gunicorn():
+    # Sobe o gunicorn com a configuração do projeto (preload_app) e um único
+    # worker, e espera até a primeira requisição ser respondida.
+    porta = porta_livre()
+    cmd = [sys.executable, '-m', 'gunicorn', '--workers', '1', '--bind', f'127.0.0.1:{porta}', 'app:create_app()']
+    processo = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            if processo.poll() is not None:
+                raise RuntimeError('gunicorn terminou antes de responder')
+            try:
+                conexao = http.client.HTTPConnection('127.0.0.1', porta, timeout=1)
+                conexao.request('GET', '/login')
+                conexao.getresponse().read()
+                conexao.close()
+                return
+            except OSError:
+                time.sleep(0.005)
+    finally:
+        processo.send_signal(signal.SIGTERM)
+        processo.wait()
+
+def medir(funcao, repeticoes):
+    funcao()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    casos = {nome: (lambda cmd=cmd: rodar_comando(cmd)) for nome, cmd in CASOS.items()}
+    casos['gunicorn até a 1ª resposta'] = rodar_gunicorn
+    for nome, funcao in casos.items():
+        tempos = medir(funcao, repeticoes)
+        print(f"{nome:35s} mediana {statistics.median(tempos):7.1f} ms  "
+              f"min {min(tempos):7.1f} ms  ({repeticoes} execuções)")
+
+if __name__ == '__main__':
+    main()
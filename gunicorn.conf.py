@@ -0,0 +1,23 @@
+# Configuração do gunicorn, lida automaticamente a partir da raiz do projeto
+# (`gunicorn main:app` ou `gunicorn "app:create_app()"`).
+# Com preload_app a aplicação é criada uma única vez no processo mestre e os
+# workers herdam o código já importado via fork.
+preload_app = True
+workers = 4
+bind = '0.0.0.0:8000'
+
+def post_fork(server, worker):
+    # O pool de conexões do SQLAlchemy criado no mestre não pode ser
+    # compartilhado entre processos: cada worker descarta as conexões herdadas
+    # (sem fechá-las, pois ainda pertencem ao mestre) e abre as suas.
+    if not server.cfg.preload_app:
+        return
+
+    from app.models import db
+
+    # Com preload, wsgi() devolve a aplicação já carregada no mestre, qualquer
+    # que seja a forma de inicialização (`main:app` ou `app:create_app()`).
+    app = server.app.wsgi()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
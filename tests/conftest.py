@@ -0,0 +1,25 @@
+import pytest
+from werkzeug.security import generate_password_hash
+from app import create_app
+from app.config import TestConfig
+from app.models import db, Usuario
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def admin(app):
+    usuario = Usuario(username='admin', email='admin@agencia.com', password=generate_password_hash('segredo'), role='admin')
+    db.session.add(usuario)
+    db.session.commit()
+    return usuario
@@ -0,0 +1,56 @@
+import pytest
+from app import create_app
+from app.config import TestConfig
+from app.models import db, Usuario
+
+def test_apps_nao_compartilham_config_nem_banco(app, admin):
+    outra = create_app(TestConfig)
+    outra.config['SECRET_ADMIN_CODE'] = 'so_nesta'
+
+    assert outra is not app
+    assert 'SECRET_ADMIN_CODE' not in app.config
+
+    with outra.app_context():
+        db.create_all()
+        assert Usuario.query.count() == 0
+        db.drop_all()
+    assert Usuario.query.count() == 1
+
+def test_create_app_aceita_dicionario():
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_ADMIN_CODE': 'abc'})
+    assert app.config['SECRET_ADMIN_CODE'] == 'abc'
+
+def test_endpoints_dos_blueprints(app):
+    endpoints = {rule.endpoint for rule in app.url_map.iter_rules()}
+    assert {
+        'auth.login', 'auth.cadastro', 'auth.logout',
+        'pacotes.index', 'pacotes.listar_pacotes', 'pacotes.cadastrar_pacote',
+        'pacotes.editar_pacote', 'pacotes.excluir_pacote',
+        'reservas.gerenciar_reservas', 'reservas.cancelar_reserva',
+        'historico.historico',
+    } <= endpoints
+
+def test_redireciona_para_login_sem_autenticacao(client):
+    resposta = client.get('/')
+    assert resposta.status_code == 302
+    assert resposta.location.startswith('/login')
+
+@pytest.mark.parametrize('url', ['/', '/pacotes', '/pacotes/cadastrar', '/reservas', '/historico'])
+def test_paginas_para_admin_logado(client, admin, url):
+    resposta = client.post('/login', data={'username': 'admin', 'password': 'segredo'})
+    assert resposta.status_code == 302
+
+    assert client.get(url).status_code == 200
+
+def test_comando_create_admin(app):
+    resultado = app.test_cli_runner().invoke(args=['create-admin', 'novo_admin', 'novo@agencia.com', 'segredo'])
+
+    assert 'criado com sucesso' in resultado.output
+    usuario = Usuario.query.filter_by(username='novo_admin').one()
+    assert usuario.role == 'admin'
+
+def test_comando_create_admin_usuario_existente(app, admin):
+    resultado = app.test_cli_runner().invoke(args=['create-admin', 'admin', 'outro@agencia.com', 'segredo'])
+
+    assert "já existe" in resultado.output
+    assert Usuario.query.count() == 1